@@ -1,26 +1,40 @@
 #!/usr/bin/env python3
 """
 Kasa Smart Plug Monitor
-Monitors a Kasa smart plug and sends email alerts when it's been off for too long.
+Monitors Kasa smart plugs and sends email alerts when one has been off for too long.
 """
 
 import asyncio
-import smtplib
+import aiosmtplib
+import functools
+import signal
 import time
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime, timedelta
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from kasa import SmartPlug
+from email.message import EmailMessage
+from kasa import SmartDeviceException, SmartPlug
 import json
 import os
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 # Configuration
 CONFIG_FILE = "kasa_config.json"
 
 # Default configuration
 DEFAULT_CONFIG = {
-    "plug_ip": "192.168.1.100",  # Replace with your plug's IP
+    "plug_ips": ["192.168.1.100"],  # Replace with your plugs' IPs
     "check_interval": 60,  # Check every 60 seconds
     "alert_threshold": 300,  # Alert if off for 5 minutes (300 seconds)
     "email": {
@@ -32,196 +46,591 @@ DEFAULT_CONFIG = {
     }
 }
 
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Email bodies, filled in with str.format when an email is sent
+ALERT_TEMPLATE = """\
+Alert: Your Electric Fence smart plug has been turned off for {minutes:.1f} minutes.
+
+Plug IP: {ip}
+Time detected off: {since}
+Current time: {now}
+
+Please check your device.
+"""
+
+RECOVERY_TEMPLATE = """\
+Good news: Your Electric Fence smart plug is back online!
+
+Plug IP: {ip}
+Time went offline: {since}
+Time back online: {now}
+Total downtime: {minutes:.1f} minutes
+
+Your electric fence is now operational again.
+"""
+
+# Seconds to wait for a plug to answer before treating it as unreachable
+PLUG_TIMEOUT = 10
+
+# Errors that mean a plug or the mail server couldn't be reached
+PLUG_ERRORS = (SmartDeviceException, OSError, asyncio.TimeoutError)
+SMTP_ERRORS = (aiosmtplib.SMTPException, OSError, asyncio.TimeoutError)
+
+# Signals that ask the monitor to shut down
+SHUTDOWN_SIGNALS = (signal.SIGINT, signal.SIGTERM)
+
+# Seconds to let in-flight emails finish on shutdown before abandoning them
+SHUTDOWN_TIMEOUT = 10
+
+# Check the config file for changes every this many plug checks
+CONFIG_RELOAD_EVERY = 5
+
+# Adaptive polling: after this many identical "on" reads, double the interval...
+STEADY_READS_BEFORE_BACKOFF = 10
+# ...up to this multiple of the configured check interval
+MAX_BACKOFF_FACTOR = 5
+
+
+def _read_config(config_file):
+    """Read and parse a JSON config file; a missing file raises OSError."""
+    data = Path(config_file).read_bytes()
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def _require(section, key, types):
+    """Return section[key], raising TypeError unless it is one of the given types."""
+    value = section[key]
+    if isinstance(value, bool) or not isinstance(value, types):
+        raise TypeError(f"{key} has invalid value {value!r}")
+    return value
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that reuses the formatted timestamp for records in the same second."""
+
+    def __init__(self, fmt=None):
+        super().__init__(fmt)
+        self._last_second = None
+        self._last_stamp = None
+
+    def formatTime(self, record, datefmt=None):
+        second = int(record.created)
+        if second != self._last_second:
+            self._last_stamp = time.strftime(TIME_FORMAT, self.converter(second))
+            self._last_second = second
+        return self.default_msec_format % (self._last_stamp, record.msecs)
+
 
 class KasaMonitor:
+    # Long-lived object polled in a loop; slots keep attribute access cheap
+    __slots__ = (
+        "config", "plugs", "off_since", "alert_sent", "logger",
+        "_alert_delivered", "_recovery_due",
+        "_config_file", "_cfg_mtime",
+        "_sender", "_recipient", "_smtp_host", "_smtp_port", "_pw",
+        "_plug_ips", "_interval", "_threshold",
+        "_smtp", "_smtp_settings", "_smtp_lock", "_pending", "_stop", "_off_since_mono",
+        "_last_state", "_steady_reads", "_next_interval", "_log_listener",
+    )
+
     def __init__(self, config_file=CONFIG_FILE):
-        self.config = self.load_config(config_file)
-        self.plug = SmartPlug(self.config["plug_ip"])
-        self.off_since = None
-        self.alert_sent = False
+        self._config_file = config_file
+        self._cfg_mtime = None
+        self.apply_config(self.load_config(config_file))
+        self.plugs = [SmartPlug(ip) for ip in self._plug_ips]
+        # Per-plug state, keyed by IP
+        self.off_since = {}  # Wall-clock time, for display in emails
+        self._off_since_mono = {}  # Monotonic time, for elapsed-time math
+        self.alert_sent = {}  # Alert queued or sent; stops duplicate sends
+        self._alert_delivered = {}  # Alert confirmed sent; gates the recovery email
+        self._recovery_due = {}  # Recoveries waiting on an in-flight alert
+        self._smtp = None
+        self._smtp_settings = None
+        self._smtp_lock = asyncio.Lock()
+        self._pending = set()
+        self._stop = asyncio.Event()
+        self._last_state = None
+        self._steady_reads = 0
+        self._next_interval = self._interval
         self.setup_logging()
 
     def load_config(self, config_file):
         """Load configuration from JSON file or create default."""
         if os.path.exists(config_file):
-            with open(config_file, 'r') as f:
-                return json.load(f)
+            # Stat before reading so an edit made mid-read triggers another reload
+            self._cfg_mtime = os.stat(config_file).st_mtime_ns
+            return _read_config(config_file)
         else:
             # Create default config file
             with open(config_file, 'w') as f:
                 json.dump(DEFAULT_CONFIG, f, indent=2)
             print(f"Created default config file: {config_file}")
             print("Please edit the configuration file with your settings.")
+            self._cfg_mtime = os.stat(config_file).st_mtime_ns
             return DEFAULT_CONFIG
 
-    def setup_logging(self):
-        """Setup logging configuration."""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('kasa_monitor.log'),
-                logging.StreamHandler()
-            ]
-        )
-        self.logger = logging.getLogger(__name__)
-
-    async def get_plug_state(self):
-        """Get the current state of the smart plug."""
+    async def reload_config_if_changed(self):
+        """Reload the config file if it was modified since it was last read."""
         try:
-            await self.plug.update()
-            return self.plug.is_on
-        except Exception as e:
-            self.logger.error(f"Error getting plug state: {e}")
-            return None
-
-    def send_email_alert(self, minutes_off):
-        """Send email alert when plug has been off too long."""
-        try:
-            msg = MIMEMultipart()
-            msg['From'] = self.config["email"]["sender_email"]
-            msg['To'] = self.config["email"]["recipient_email"]
-            msg['Subject'] = "Electric Fence - Device Off"
+            mtime = os.stat(self._config_file).st_mtime_ns
+            if mtime == self._cfg_mtime:
+                return False
+            # Don't retry (or re-log) a bad file until it changes again
+            self._cfg_mtime = mtime
+            # Read and parse off the event loop so a slow disk can't stall polling.
+            # Unlike load_config, a file deleted in the meantime is an error here.
+            config = await asyncio.to_thread(_read_config, self._config_file)
+        except (OSError, ValueError) as e:
+            self.logger.error("Failed to reload config: %s", e)
+            return False
 
-            body = f"""
-            Alert: Your Electric Fence smart plug has been turned off for {minutes_off:.1f} minutes.
+        old_plug_ips = self._plug_ips
+        old_interval = self._interval
 
-            Plug IP: {self.config["plug_ip"]}
-            Time detected off: {self.off_since.strftime('%Y-%m-%d %H:%M:%S')}
-            Current time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+        try:
+            self.apply_config(config)
+        except (KeyError, TypeError, ValueError) as e:
+            # Keep monitoring with the previous config rather than stopping
+            self.logger.error("Ignoring invalid reloaded config: %r", e)
+            return False
 
-            Please check your device.
-            """
+        if self._plug_ips != old_plug_ips:
+            self.plugs = [SmartPlug(ip) for ip in self._plug_ips]
+            for ip in set(old_plug_ips) - set(self._plug_ips):
+                self.off_since.pop(ip, None)
+                self._off_since_mono.pop(ip, None)
+                self.alert_sent.pop(ip, None)
+                self._alert_delivered.pop(ip, None)
+                self._recovery_due.pop(ip, None)
+        if self._interval != old_interval:
+            # Restart adaptive polling from the new base interval
+            self._next_interval = self._interval
+            self._steady_reads = 0
+
+        self.logger.info("Reloaded configuration")
+        return True
+
+    def apply_config(self, config):
+        """Validate a config and cache frequently used values as attributes.
+
+        Raises KeyError, TypeError or ValueError for a malformed config, in
+        which case nothing is changed.
+        """
+        email = config["email"]
+        sender = _require(email, "sender_email", str)
+        recipient = _require(email, "recipient_email", str)
+        smtp_host = _require(email, "smtp_server", str)
+        smtp_port = _require(email, "smtp_port", int)
+        pw = _require(email, "sender_password", str)
+
+        # Older configs name a single plug with "plug_ip"
+        if "plug_ips" in config:
+            plug_ips = list(_require(config, "plug_ips", list))
+        else:
+            plug_ips = [_require(config, "plug_ip", str)]
+        if not plug_ips or not all(isinstance(ip, str) for ip in plug_ips):
+            raise ValueError("plug_ips must be a non-empty list of strings")
+
+        interval = _require(config, "check_interval", (int, float))
+        threshold = _require(config, "alert_threshold", (int, float))
+        if interval <= 0 or threshold <= 0:
+            raise ValueError("check_interval and alert_threshold must be positive")
+
+        self.config = config
+        self._sender = sender
+        self._recipient = recipient
+        self._smtp_host = smtp_host
+        self._smtp_port = smtp_port
+        self._pw = pw
+        self._plug_ips = plug_ips
+        self._interval = interval
+        self._threshold = threshold
 
-            msg.attach(MIMEText(body, 'plain'))
+    def setup_logging(self):
+        """Setup logging configuration.
+
+        Records are queued and written by a background thread so file and
+        console I/O never blocks the event loop.
+        """
+        formatter = CachedTimeFormatter('%(asctime)s - %(levelname)s - %(message)s')
+        handlers = [
+            logging.FileHandler('kasa_monitor.log'),
+            logging.StreamHandler()
+        ]
+        for handler in handlers:
+            handler.setFormatter(formatter)
+
+        log_queue = queue.SimpleQueue()
+        queue_handler = QueueHandler(log_queue)
+        # Only merge the message on the event loop; timestamps are added by the listener
+        queue_handler.setFormatter(logging.Formatter('%(message)s'))
+
+        logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
+        self._log_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        self._log_listener.start()
+        self.logger = logging.getLogger(__name__)
 
-            return self._send_email(msg)
+    async def get_states(self):
+        """Get the current state of every plug, updating them concurrently.
+
+        Returns a list of (ip, is_on) pairs; is_on is None if a plug could not be read.
+        """
+        # Never wait longer than a check interval, so one unresponsive plug
+        # can't hold up the states of the others
+        timeout = min(PLUG_TIMEOUT, self._interval)
+        results = await asyncio.gather(
+            *(asyncio.wait_for(plug.update(), timeout=timeout) for plug in self.plugs),
+            return_exceptions=True
+        )
 
-        except Exception as e:
-            self.logger.error(f"Failed to send email alert: {e}")
-            return False
+        states = []
+        for ip, plug, result in zip(self._plug_ips, self.plugs, results):
+            if isinstance(result, asyncio.TimeoutError):
+                self.logger.error("Timed out after %ss getting state of plug %s", timeout, ip)
+                states.append((ip, None))
+            elif isinstance(result, PLUG_ERRORS):
+                self.logger.error("Error getting state of plug %s: %s", ip, result)
+                states.append((ip, None))
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                states.append((ip, plug.is_on))
+        return states
+
+    async def send_email_alert(self, ip, minutes_off, off_since):
+        """Send email alert when plug has been off too long."""
+        return await self._send_templated(
+            "Electric Fence - Device Off", ALERT_TEMPLATE,
+            ip=ip, minutes=minutes_off, since=off_since
+        )
 
-    def send_recovery_email(self, total_downtime_minutes):
+    async def send_recovery_email(self, ip, total_downtime_minutes, off_since):
         """Send email alert when plug turns back on after being off."""
+        return await self._send_templated(
+            "Electric Fence - Device Back Online", RECOVERY_TEMPLATE,
+            ip=ip, minutes=total_downtime_minutes, since=off_since
+        )
+
+    async def _send_templated(self, subject, template, since, **fields):
+        """Fill in an email body template and send it."""
+        msg = EmailMessage()
+        msg['From'] = self._sender
+        msg['To'] = self._recipient
+        msg['Subject'] = subject
+        msg.set_content(template.format(
+            since=since.strftime(TIME_FORMAT),
+            now=datetime.now().strftime(TIME_FORMAT),
+            **fields
+        ))
+
+        return await self._send_email(msg)
+
+    async def _get_smtp(self):
+        """Return a live SMTP connection, reconnecting if needed.
+
+        Also reconnects if the SMTP settings changed since the connection was opened.
+        """
+        settings = (self._smtp_host, self._smtp_port, self._sender, self._pw)
+        if self._smtp is not None and self._smtp.is_connected and self._smtp_settings == settings:
+            try:
+                if (await self._smtp.noop()).code == 250:
+                    return self._smtp
+            except SMTP_ERRORS:
+                pass
+        await self._close_smtp()
+
+        server = aiosmtplib.SMTP(
+            hostname=self._smtp_host,
+            port=self._smtp_port,
+            start_tls=False
+        )
         try:
-            msg = MIMEMultipart()
-            msg['From'] = self.config["email"]["sender_email"]
-            msg['To'] = self.config["email"]["recipient_email"]
-            msg['Subject'] = "Electric Fence - Device Back Online"
+            await server.connect()
+            await server.starttls()
+            await server.login(
+                self._sender,
+                self._pw
+            )
+        except SMTP_ERRORS:
+            # Don't leak the socket when the handshake or login fails
+            server.close()
+            raise
+        self._smtp = server
+        self._smtp_settings = settings
+        return server
+
+    async def _close_smtp(self):
+        """Close the persistent SMTP connection, if any."""
+        if self._smtp is None:
+            return
+        try:
+            await asyncio.wait_for(self._smtp.quit(), timeout=SHUTDOWN_TIMEOUT)
+        except SMTP_ERRORS:
+            self._smtp.close()
+        self._smtp = None
+
+    async def _send_email(self, msg):
+        """Helper method to send email over the persistent SMTP connection.
+
+        Sends are serialized so concurrent alert/recovery tasks never
+        interleave commands on the shared connection.
+        """
+        async with self._smtp_lock:
+            try:
+                # Connection/login failures are not retried; only a failed send is
+                server = await self._get_smtp()
+                try:
+                    await server.send_message(msg)
+                except aiosmtplib.SMTPException:
+                    # Stale connection - reconnect and retry once
+                    await self._close_smtp()
+                    await (await self._get_smtp()).send_message(msg)
+
+                return True
+
+            except SMTP_ERRORS as e:
+                await self._close_smtp()
+                self.logger.error("Failed to send email: %s", e)
+                return False
+
+    def _spawn(self, coro, on_done):
+        """Run an email send in the background so polling stays on schedule."""
+        task = asyncio.create_task(coro)
+        self._pending.add(task)
+        task.add_done_callback(on_done)
+        return task
+
+    def _task_succeeded(self, task):
+        """Return a finished email task's result, logging it if it crashed."""
+        self._pending.discard(task)
+        if task.cancelled():
+            return False
+        if task.exception() is not None:
+            self.logger.error("Email task failed", exc_info=task.exception())
+            return False
+        return task.result()
+
+    def _on_alert_done(self, ip, minutes_off, off_since, task):
+        """Record the outcome of a background alert email."""
+        delivered = self._task_succeeded(task)
+        if delivered:
+            self.logger.info("Alert email sent - plug %s off for %.1f minutes", ip, minutes_off)
+
+        if self.off_since.get(ip) is off_since:
+            # Plug is still in the outage this alert was about
+            if delivered:
+                self._alert_delivered[ip] = True
+            else:
+                # Allow the alert to be retried on the next check
+                self.alert_sent[ip] = False
+            return
+
+        # Plug came back on while the alert was in flight; only follow up a delivered alert
+        due = self._recovery_due.get(ip)
+        if due is not None and due[1] is off_since:
+            del self._recovery_due[ip]
+            if delivered:
+                self._send_recovery(ip, *due)
+
+    def _send_recovery(self, ip, total_downtime, off_since):
+        """Send the recovery email in the background."""
+        self._spawn(
+            self.send_recovery_email(ip, total_downtime, off_since),
+            functools.partial(self._on_recovery_done, ip, total_downtime)
+        )
 
-            body = f"""
-            Good news: Your Electric Fence smart plug is back online!
+    def _on_recovery_done(self, ip, total_downtime, task):
+        """Record the outcome of a background recovery email."""
+        if self._task_succeeded(task):
+            self.logger.info("Recovery email sent - plug %s was off for %.1f minutes", ip, total_downtime)
 
-            Plug IP: {self.config["plug_ip"]}
-            Time went offline: {self.off_since.strftime('%Y-%m-%d %H:%M:%S')}
-            Time back online: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-            Total downtime: {total_downtime_minutes:.1f} minutes
+    def stop(self):
+        """Ask the monitor loop to exit; it wakes immediately rather than after the next check."""
+        self._stop.set()
 
-            Your electric fence is now operational again.
-            """
+        # Restore default signal handling so a second Ctrl-C/SIGTERM exits immediately
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        for sig in SHUTDOWN_SIGNALS:
+            try:
+                loop.remove_signal_handler(sig)
+            except NotImplementedError:
+                pass
+
+    async def drain_pending(self, timeout=SHUTDOWN_TIMEOUT):
+        """Wait up to timeout seconds for in-flight email sends, then cancel the rest."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        pending = set()
+        # Loop because a finishing alert may queue its recovery email
+        while any(not task.done() for task in self._pending):
+            remaining = deadline - loop.time()
+            _, pending = await asyncio.wait(
+                {task for task in self._pending if not task.done()},
+                timeout=max(remaining, 0)
+            )
+            if pending:
+                break
+        if pending:
+            self.logger.warning("Abandoning %d unsent email(s) on shutdown", len(pending))
+            for task in pending:
+                task.cancel()
+            await asyncio.wait(pending)
+
+    async def close(self):
+        """Finish pending emails, then release the SMTP connection and log listener."""
+        await self.drain_pending()
+        await self._close_smtp()
+        self._log_listener.stop()
+
+    async def _poll_once(self):
+        """Check every plug once and act on any state changes."""
+        states = await self.get_states()
+        time_offs = [self._handle_state(ip, is_on) for ip, is_on in states]
+        self._update_interval(states, time_offs)
+        return states
+
+    def _handle_state(self, ip, is_on):
+        """Act on one plug's state; return how long it has been off, if it is off."""
+        time_off = None
+
+        if is_on is None:
+            self.logger.warning("Could not determine state of plug %s", ip)
+        elif is_on:
+            # Plug is on
+            if ip in self.off_since:
+                # Calculate total downtime
+                total_downtime = (time.monotonic() - self._off_since_mono[ip]) / 60
+
+                # Send recovery email only if the alert actually went out
+                if self._alert_delivered.get(ip):
+                    self._send_recovery(ip, total_downtime, self.off_since[ip])
+                elif self.alert_sent[ip]:
+                    # Alert still in flight; _on_alert_done decides
+                    self._recovery_due[ip] = (total_downtime, self.off_since[ip])
+
+                self.logger.info("Plug %s turned back on after %.1f minutes", ip, total_downtime)
+                del self.off_since[ip]
+                del self._off_since_mono[ip]
+                del self.alert_sent[ip]
+                self._alert_delivered.pop(ip, None)
+        else:
+            # Plug is off
+            if ip not in self.off_since:
+                # Just turned off
+                self.off_since[ip] = datetime.now()
+                self._off_since_mono[ip] = time.monotonic()
+                self.alert_sent[ip] = False
+                time_off = 0
+                self.logger.info("Plug %s turned off", ip)
+            else:
+                # Has been off for some time
+                time_off = time.monotonic() - self._off_since_mono[ip]
+                minutes_off = time_off / 60
+
+                self.logger.info("Plug %s has been off for %.1f minutes", ip, minutes_off)
+
+                # Check if we should send alert
+                if time_off >= self._threshold and not self.alert_sent[ip]:
+                    # Mark as sent up front so a slow send isn't duplicated
+                    self.alert_sent[ip] = True
+                    self._spawn(
+                        self.send_email_alert(ip, minutes_off, self.off_since[ip]),
+                        functools.partial(self._on_alert_done, ip, minutes_off, self.off_since[ip])
+                    )
+
+        return time_off
+
+    def _update_interval(self, states, time_offs):
+        """Back off polling while every plug is steadily on, tighten it otherwise."""
+        base = self._interval
+
+        if all(is_on for _, is_on in states) and states == self._last_state:
+            self._steady_reads += 1
+            if self._steady_reads >= STEADY_READS_BEFORE_BACKOFF:
+                self._steady_reads = 0
+                self._next_interval = min(base * MAX_BACKOFF_FACTOR, self._next_interval * 2)
+        else:
+            # State changed, unknown, or off - poll at the base rate
+            self._steady_reads = 0
+            self._next_interval = base
 
-            msg.attach(MIMEText(body, 'plain'))
+            # Don't sleep past the point where an alert is due
+            for (ip, _), time_off in zip(states, time_offs):
+                if time_off is not None and not self.alert_sent[ip]:
+                    remaining = self._threshold - time_off
+                    if remaining > 0:
+                        self._next_interval = min(self._next_interval, remaining)
 
-            return self._send_email(msg)
+        self._last_state = states
 
-        except Exception as e:
-            self.logger.error(f"Failed to send recovery email: {e}")
-            return False
+    async def monitor_loop(self):
+        """Main monitoring loop."""
+        self.logger.info("Starting Kasa smart plug monitor...")
+        self.logger.info("Monitoring plugs at %s", ", ".join(self._plug_ips))
+        self.logger.info("Check interval: %s seconds", self._interval)
+        self.logger.info("Alert threshold: %s seconds", self._threshold)
 
-    def _send_email(self, msg):
-        """Helper method to send email."""
+        loop = asyncio.get_running_loop()
+        checks = 0
+        stopper = asyncio.create_task(self._stop.wait())
         try:
-            # Connect to SMTP server
-            server = smtplib.SMTP(
-                self.config["email"]["smtp_server"],
-                self.config["email"]["smtp_port"]
-            )
-            server.starttls()
-            server.login(
-                self.config["email"]["sender_email"],
-                self.config["email"]["sender_password"]
-            )
+            while not stopper.done():
+                checks += 1
+                if checks % CONFIG_RELOAD_EVERY == 0:
+                    await self.reload_config_if_changed()
 
-            # Send email
-            text = msg.as_string()
-            server.sendmail(
-                self.config["email"]["sender_email"],
-                self.config["email"]["recipient_email"],
-                text
-            )
-            server.quit()
+                started = loop.time()
 
-            return True
+                # Race the check against a stop request so shutdown isn't delayed.
+                # get_states bounds each plug update, so the check itself always finishes.
+                poll = asyncio.create_task(self._poll_once())
+                done, _ = await asyncio.wait(
+                    {poll, stopper},
+                    return_when=asyncio.FIRST_COMPLETED
+                )
 
-        except Exception as e:
-            self.logger.error(f"Failed to send email: {e}")
-            return False
+                if poll not in done:
+                    poll.cancel()
+                    break
 
-    async def monitor_loop(self):
-        """Main monitoring loop."""
-        self.logger.info("Starting Kasa smart plug monitor...")
-        self.logger.info(f"Monitoring plug at {self.config['plug_ip']}")
-        self.logger.info(f"Check interval: {self.config['check_interval']} seconds")
-        self.logger.info(f"Alert threshold: {self.config['alert_threshold']} seconds")
+                # Plug errors are handled in get_states; anything else is a bug
+                poll.result()
 
-        while True:
-            try:
-                # Get current plug state
-                is_on = await self.get_plug_state()
-
-                if is_on is None:
-                    self.logger.warning("Could not determine plug state")
-                elif is_on:
-                    # Plug is on
-                    if self.off_since:
-                        # Calculate total downtime
-                        total_downtime = (datetime.now() - self.off_since).total_seconds() / 60
-
-                        # Send recovery email if we previously sent an alert
-                        if self.alert_sent:
-                            if self.send_recovery_email(total_downtime):
-                                self.logger.info(f"Recovery email sent - plug was off for {total_downtime:.1f} minutes")
-
-                        self.logger.info(f"Plug turned back on after {total_downtime:.1f} minutes")
-                        self.off_since = None
-                        self.alert_sent = False
-                else:
-                    # Plug is off
-                    now = datetime.now()
-
-                    if self.off_since is None:
-                        # Just turned off
-                        self.off_since = now
-                        self.logger.info("Plug turned off")
-                    else:
-                        # Has been off for some time
-                        time_off = (now - self.off_since).total_seconds()
-                        minutes_off = time_off / 60
-
-                        self.logger.info(f"Plug has been off for {minutes_off:.1f} minutes")
-
-                        # Check if we should send alert
-                        if time_off >= self.config["alert_threshold"] and not self.alert_sent:
-                            if self.send_email_alert(minutes_off):
-                                self.alert_sent = True
-                                self.logger.info(f"Alert email sent - plug off for {minutes_off:.1f} minutes")
-
-                # Wait before next check
-                await asyncio.sleep(self.config["check_interval"])
-
-            except KeyboardInterrupt:
-                self.logger.info("Monitor stopped by user")
-                break
-            except Exception as e:
-                self.logger.error(f"Unexpected error in monitor loop: {e}")
-                await asyncio.sleep(self.config["check_interval"])
+                # Wait out the rest of the interval, waking early on stop
+                remaining = self._next_interval - (loop.time() - started)
+                if remaining > 0:
+                    await asyncio.wait({stopper}, timeout=remaining)
+        finally:
+            stopper.cancel()
+
+        self.logger.info("Monitor stopped")
 
 
 async def main():
     """Main function to run the monitor."""
     monitor = KasaMonitor()
-    await monitor.monitor_loop()
+
+    loop = asyncio.get_running_loop()
+    for sig in SHUTDOWN_SIGNALS:
+        try:
+            loop.add_signal_handler(sig, monitor.stop)
+        except NotImplementedError:
+            # Signal handlers are unavailable on Windows event loops
+            pass
+
+    try:
+        await monitor.monitor_loop()
+    finally:
+        await monitor.close()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    # Prefer uvloop's faster event loop when it is installed (uvloop.run needs >= 0.18)
+    if uvloop and hasattr(uvloop, "run"):
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
\ No newline at end of file